@@ -321,7 +321,7 @@ def simulate_week(payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         schedule_grid = _validate_schedule_grid(data.get("schedule"))
         current_week = _require_int(data.get("current_week", 1), "current_week")
 
-        context = GameContext(get_session)
+        context = GameContext(get_session, animate=False)
         context.set_player(player_id, school_id)
         try:
             execution = execute_schedule_core(context, schedule_grid, current_week)
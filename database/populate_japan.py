@@ -26,6 +26,7 @@ from database.setup_db import (
 )
 from world.school_philosophy import PHILOSOPHY_MATRIX
 from game.archetypes import assign_player_archetype
+from game.weekly_scheduler_core import invalidate_opponent_cache
 from world.coach_generation import generate_coach_for_school
 from player_roles.two_way import roll_two_way_profile
 
@@ -758,6 +759,8 @@ def populate_world():
             session.query(School).delete()
             session.query(Coach).delete()
             session.commit()
+            # Every school id is about to change; drop cached opponent pools.
+            invalidate_opponent_cache()
         except Exception as e:
             print(f"Error wiping data: {e}")
             session.rollback()
@@ -6,6 +6,7 @@ import sqlalchemy
 from datetime import datetime, timezone
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -32,6 +33,33 @@ if not os.path.exists(db_dir):
 
 # Create engine globally but we might need to dispose it for deletion
 engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"timeout": 10})
+
+# WAL keeps a -wal/-shm pair next to the database; delete them with the file.
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm")
+
+
+@event.listens_for(engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Switch every pooled connection to WAL with relaxed syncing.
+    Commits append to the WAL without a full fsync, so the weekly commit
+    loop stays cheap. Trade-off: a power loss can drop the last few
+    commits, but the database file itself stays consistent.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+
+def remove_sqlite_sidecars(db_path):
+    """Delete leftover WAL/shared-memory files so they never attach to a new database."""
+    for suffix in SQLITE_SIDECAR_SUFFIXES:
+        sidecar = f"{db_path}{suffix}"
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
 Base = declarative_base()
 
 SessionLocal = sessionmaker(bind=engine)
@@ -82,6 +110,7 @@ def safe_delete_db(db_path):
         try:
             if os.path.exists(db_path):
                 os.remove(db_path)
+            remove_sqlite_sidecars(db_path)
             print("Database deleted successfully.")
             
             # Re-create engine after deletion if we plan to rebuild immediately
@@ -20,6 +20,9 @@ _DEFAULT_ACTION_COSTS: Dict[str, int] = {
 
 HEAVY_TRAINING_ACTIONS = {"train_power", "train_speed", "train_stamina"}
 LIGHT_TRAINING_ACTIONS = {"train_control", "train_contact"}
+A_TEAM_MATCH_ACTIONS = frozenset({"practice_match"})
+B_TEAM_MATCH_ACTIONS = frozenset({"b_team_match"})
+MATCH_ACTIONS = A_TEAM_MATCH_ACTIONS | B_TEAM_MATCH_ACTIONS
 
 _DEFAULT_ACTION_METADATA: Dict[str, Dict[str, str]] = {
     "rest": {"short": "REST", "desc": "Recover fatigue and clear the head.", "colour": "GREEN"},
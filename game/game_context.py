@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Iterable
 from sqlalchemy.orm import Session
 
 
@@ -14,6 +14,8 @@ class GameContext:
     school_id: Optional[int] = None
     _session: Optional[Session] = field(default=None, init=False, repr=False)
     temp_effects: Dict[str, Any] = field(default_factory=dict)
+    # Narrate practice matches while executing a schedule; headless callers turn this off.
+    animate: bool = True
 
     @property
     def session(self) -> Session:
@@ -44,5 +46,10 @@ class GameContext:
     def clear_temp_effect(self, key: str) -> None:
         self.temp_effects.pop(key, None)
 
+    def clear_temp_effects(self, keys: Iterable[str]) -> None:
+        effects = self.temp_effects
+        for key in keys:
+            effects.pop(key, None)
+
     def clear_all_temp_effects(self) -> None:
         self.temp_effects.clear()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Any, Iterable, Mapping, Optional, Sequence
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -16,15 +16,19 @@ def _clamp(value: float, low: int = REL_MIN, high: int = REL_MAX) -> int:
     return int(max(low, min(high, round(value))))
 
 
-def get_or_create_relationship(session: Session, player_id: int) -> PlayerRelationship:
+def _get_or_create_relationship(session: Session, player_id: int) -> Tuple[PlayerRelationship, bool]:
     rel = session.query(PlayerRelationship).filter_by(player_id=player_id).one_or_none()
     if rel:
-        return rel
+        return rel, False
 
     rel = PlayerRelationship(player_id=player_id)
     session.add(rel)
     session.flush()
-    return rel
+    return rel, True
+
+
+def get_or_create_relationship(session: Session, player_id: int) -> PlayerRelationship:
+    return _get_or_create_relationship(session, player_id)[0]
 
 
 def _choose_best_player(candidates, default=None, *, key=None):
@@ -97,8 +101,10 @@ ARCHETYPE_REBOUND_BONUS = {
 
 
 def seed_relationships(session: Session, player: Player) -> PlayerRelationship:
-    rel = get_or_create_relationship(session, player.id)
+    rel, created = _get_or_create_relationship(session, player.id)
     school_players = _candidate_players(session, player.school_id, player.id)
+    # A brand-new row is always committed, even for a player with no teammates.
+    seeded = created
 
     if not rel.captain_id and school_players:
         captain = next((p for p in school_players if p.is_captain), None)
@@ -110,6 +116,7 @@ def seed_relationships(session: Session, player: Player) -> PlayerRelationship:
         if captain:
             rel.captain_id = captain.id
             rel.captain_rel = random.randint(55, 70)
+            seeded = True
 
     if not rel.battery_partner_id and school_players:
         if player.position == "Pitcher":
@@ -122,6 +129,7 @@ def seed_relationships(session: Session, player: Player) -> PlayerRelationship:
         if partner:
             rel.battery_partner_id = partner.id
             rel.battery_rel = random.randint(50, 65)
+            seeded = True
 
     if not rel.rival_id and school_players:
         pool = [p for p in school_players if p.position == player.position]
@@ -131,9 +139,13 @@ def seed_relationships(session: Session, player: Player) -> PlayerRelationship:
         if rival:
             rel.rival_id = rival.id
             rel.rivalry_score = random.randint(40, 55)
+            seeded = True
 
-    session.add(rel)
-    session.commit()
+    # Already-seeded rows are read far more often than written; only pay for a
+    # commit when the row is new or a slot was actually filled in.
+    if seeded:
+        session.add(rel)
+        session.commit()
     return rel
 
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import random
-from typing import MutableSequence, Optional, Sequence, TypeVar
+from typing import Callable, MutableSequence, Optional, Sequence, TypeVar
 
 _T = TypeVar("_T")
 
@@ -12,20 +12,17 @@ class DeterministicRNG:
 
     def __init__(self, seed: Optional[int] = None) -> None:
         self._random = random.Random(seed)
+        # The match engine draws several numbers per pitch; binding the plain
+        # draws to the generator skips a wrapper frame on each one. Reseeding
+        # keeps the same Random instance, so these stay valid.
+        self.random: Callable[[], float] = self._random.random
+        self.randint: Callable[[int, int], int] = self._random.randint
+        self.uniform: Callable[[float, float], float] = self._random.uniform
 
     def seed(self, seed_value: Optional[int]) -> None:
         """Reseed the underlying generator (``None`` resets to system state)."""
         self._random.seed(seed_value)
 
-    def random(self) -> float:
-        return self._random.random()
-
-    def randint(self, a: int, b: int) -> int:
-        return self._random.randint(a, b)
-
-    def uniform(self, a: float, b: float) -> float:
-        return self._random.uniform(a, b)
-
     def choice(self, seq: Sequence[_T]) -> _T:
         if not seq:
             raise ValueError("Cannot choose from an empty sequence")
@@ -5,10 +5,13 @@ import sqlite3
 from datetime import datetime
 from config import USER_DATA_DIR, DB_PATH
 from ui.ui_display import Colour, clear_screen
+from game.weekly_scheduler_core import invalidate_opponent_cache
 from database.setup_db import (
     close_all_sessions,
     create_database,
+    engine,
     get_session,
+    remove_sqlite_sidecars,
     GameState,
 )
 
@@ -196,11 +199,16 @@ def load_game(slot_num):
 
     try:
         close_all_sessions()
+        # Pooled connections still map the old WAL; drop them before swapping files.
+        engine.dispose()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
+        remove_sqlite_sidecars(DB_PATH)
 
         _backup_database(source_path, DB_PATH)
         create_database()  # ensures schema + GameState row
+        # The restored world has its own school ids.
+        invalidate_opponent_cache()
 
         if not _gamestate_present():
             return False, "Save loaded but GameState data is missing."
@@ -213,6 +221,7 @@ def delete_save(slot_num):
     target_path = os.path.join(USER_DATA_DIR, f"save_slot_{slot_num}.db")
     if os.path.exists(target_path):
         os.remove(target_path)
+        remove_sqlite_sidecars(target_path)
         return True, "Deleted."
     return False, "Not found."
 
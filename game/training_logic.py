@@ -7,6 +7,7 @@ from typing import List, Optional, Tuple
 from .health_system import check_injury_risk, apply_injury, get_performance_modifiers
 from database.setup_db import Player
 from game.academic_system import resolve_study_session, clamp, is_academically_eligible
+from game.constants import MATCH_ACTIONS
 from game.game_context import GameContext
 from game.personality_effects import adjust_player_morale, decay_slump
 from game.player_progression import (
@@ -23,6 +24,20 @@ logger = logging.getLogger(__name__)
 PROGRESSION_DEBUG = os.getenv("PROGRESSION_DEBUG", "").lower() in {"1", "true", "yes"}
 
 
+# action_type -> (stat, base gain, synergy growth styles, synergy multiplier)
+_DRILL_TABLE = {
+    'train_control': ('control', 1.0, frozenset({'Technical'}), 1.5),
+    'train_velocity': ('velocity', 0.3, frozenset({'Power', 'Pitcher'}), 1.5),  # Vel is hard to raise
+    'train_stamina': ('stamina', 1.0, frozenset({'Balanced'}), 1.2),
+    'train_power': ('power', 1.0, frozenset({'Power'}), 1.5),
+    'train_contact': ('contact', 1.0, frozenset({'Technical'}), 1.5),
+    'train_speed': ('speed', 1.0, frozenset({'Speed'}), 1.5),
+}
+
+# Drill efficiency indexed by fatigue: full gains to 50, 0.7 to 80, 0.3 beyond.
+_FATIGUE_EFFICIENCY = (1.0,) * 51 + (0.7,) * 30 + (0.3,) * 20
+
+
 def _get_player(context: GameContext) -> Optional[Player]:
     if context.player_id is None:
         return None
@@ -173,7 +188,7 @@ def apply_scheduled_action(
     is_rigorous = action_type and (action_type.startswith('train_') or action_type in ['practice_match', 'team_practice', 'b_team_match'])
     
     if is_rigorous:
-        intensity = 1.5 if 'match' in action_type else 1.0
+        intensity = 1.5 if action_type in MATCH_ACTIONS else 1.0
         # Check risk (incorporating fatigue & conditioning)
         is_injured, severity = check_injury_risk(fatigue, intensity, conditioning)
         
@@ -269,33 +284,19 @@ def apply_scheduled_action(
     # 8. SPECIFIC DRILLS
     elif action_type and action_type.startswith('train_'):
         # Efficiency drops if too tired
-        efficiency = 1.0
-        if fatigue > 50: efficiency = 0.7
-        if fatigue > 80: efficiency = 0.3
+        efficiency = _FATIGUE_EFFICIENCY[min(100, max(0, int(fatigue)))]
         
-        synergy = 1.0
         # Synergy: Bonus if drill matches Growth Style
-        drill = action_type.replace('train_', '')
-        
-        if drill == 'control':
-            stat_gains = {'control': 1.0}
-            if style == 'Technical': synergy = 1.5
-        elif drill == 'velocity':
-            stat_gains = {'velocity': 0.3} # Vel is hard to raise
-            if style == 'Power' or style == 'Pitcher': synergy = 1.5
-        elif drill == 'stamina':
-            stat_gains = {'stamina': 1.0}
-            if style == 'Balanced': synergy = 1.2
-        elif drill == 'power':
-            stat_gains = {'power': 1.0}
-            if style == 'Power': synergy = 1.5
-        elif drill == 'contact':
-            stat_gains = {'contact': 1.0}
-            if style == 'Technical': synergy = 1.5
-        elif drill == 'speed':
-            stat_gains = {'speed': 1.0}
-            if style == 'Speed': synergy = 1.5
-            
+        drill_cfg = _DRILL_TABLE.get(action_type)
+        if drill_cfg:
+            stat, base, synergy_styles, synergy_mult = drill_cfg
+            stat_gains = {stat: base}
+            synergy = synergy_mult if style in synergy_styles else 1.0
+            drill = stat
+        else:
+            synergy = 1.0
+            drill = action_type[len('train_'):]
+
         # Apply final calculation: Base * Efficiency * Synergy * Conditioning Mod
         for k in stat_gains:
             stat_gains[k] *= (efficiency * synergy * mods.get('training_gain', 1.0))
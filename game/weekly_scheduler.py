@@ -1,12 +1,20 @@
+import functools
 import json
 import time
 import sys
 import random
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+try:  # Optional faster encoder for persisted payloads; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
 
 from database.setup_db import Player, GameState
-from sqlalchemy.orm import object_session
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
 from game.constants import (
     ACTION_COSTS,
     ACTION_METADATA,
@@ -31,21 +39,23 @@ from game.academic_system import (
     is_academically_eligible,
     required_score_for_school,
 )
-from game.dialogue_manager import run_dialogue_event
 from game.weekly_scheduler_core import (
     DAYS_OF_WEEK,
     SLOTS,
     WeekSummary,
     execute_schedule_core,
+    invalidate_opponent_cache,
 )
 from world.media_engine import generate_weekly_news
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoachOrder:
     key: str
     description: str
-    requirement: Dict[str, object]
+    req_type: str
+    req_actions: Tuple[str, ...]
+    req_count: int
     reward_trust: int
     reward_ability_points: int
 
@@ -54,29 +64,27 @@ COACH_ORDER_DEFS: Tuple[CoachOrder, ...] = (
     CoachOrder(
         key="run_50km",
         description="Run 50km this week (plan 3 Speed drills).",
-        requirement={"type": "action_count", "actions": ["train_speed"], "count": 3},
+        req_type="action_count",
+        req_actions=("train_speed",),
+        req_count=3,
         reward_trust=4,
         reward_ability_points=1,
     ),
     CoachOrder(
         key="practice_pickoffs",
         description="Practice pick-offs twice this week.",
-        requirement={
-            "type": "action_count",
-            "actions": ["train_control", "team_practice"],
-            "count": 2,
-        },
+        req_type="action_count",
+        req_actions=("train_control", "team_practice"),
+        req_count=2,
         reward_trust=3,
         reward_ability_points=1,
     ),
     CoachOrder(
         key="bullpen_command",
         description="Coach wants two high-intensity team reps.",
-        requirement={
-            "type": "action_count",
-            "actions": ["team_practice", "practice_match", "b_team_match"],
-            "count": 2,
-        },
+        req_type="action_count",
+        req_actions=("team_practice", "practice_match", "b_team_match"),
+        req_count=2,
         reward_trust=5,
         reward_ability_points=2,
     ),
@@ -151,21 +159,74 @@ def _summarize_execution(current_week: int, execution) -> WeekSummary:
 
 # --- CONSTANT HELPERS ---
 
+_ACTION_META_KEY_TABLE: Dict[str, str] = {
+    **{action: 'train_heavy' for action in HEAVY_TRAINING_ACTIONS},
+    **{action: 'train_light' for action in LIGHT_TRAINING_ACTIONS},
+}
+
+_ACTION_COST_TABLE: Dict[str, int] = {
+    **ACTION_COSTS,
+    **{action: ACTION_COSTS['train_heavy'] for action in HEAVY_TRAINING_ACTIONS},
+    **{action: ACTION_COSTS['train_light'] for action in LIGHT_TRAINING_ACTIONS},
+}
+
+
 def _action_meta_key(action: Optional[str]) -> Optional[str]:
     if not action:
         return None
-    if action in HEAVY_TRAINING_ACTIONS:
-        return 'train_heavy'
-    if action in LIGHT_TRAINING_ACTIONS:
-        return 'train_light'
-    if action.startswith('train_'):
-        return 'train_heavy'
-    return action
+    meta_key = _ACTION_META_KEY_TABLE.get(action)
+    if meta_key is None:
+        # Resolve unlisted actions once, then serve them from the table.
+        meta_key = 'train_heavy' if action.startswith('train_') else action
+        _ACTION_META_KEY_TABLE[action] = meta_key
+    return meta_key
+
+
+_ACTION_META_CACHE: Dict[str, Dict[str, str]] = {
+    key: ACTION_METADATA.get(_action_meta_key(key), ACTION_METADATA_DEFAULT)
+    for key in (*ACTION_COSTS, *HEAVY_TRAINING_ACTIONS, *LIGHT_TRAINING_ACTIONS)
+}
+
 
+def _action_meta(action: Optional[str]) -> Dict[str, str]:
+    if not action:
+        return ACTION_METADATA_DEFAULT
+    meta = _ACTION_META_CACHE.get(action)
+    if meta is None:
+        # Same compute-once pattern as _action_meta_key: unlisted actions are cached on first use.
+        meta = ACTION_METADATA.get(_action_meta_key(action), ACTION_METADATA_DEFAULT)
+        _ACTION_META_CACHE[action] = meta
+    return meta
+
+
+# action -> fully styled board cells, indexed by ``is_mandatory << 1 | is_cursor``.
+_TOKEN_CACHE: Dict[Optional[str], Tuple[str, str, str, str]] = {}
+
+
+def _slot_tokens(action: Optional[str]) -> Tuple[str, str, str, str]:
+    tokens = _TOKEN_CACHE.get(action)
+    if tokens is None:
+        meta = _action_meta(action)
+        base = f"{meta['short'][:4] if action else '....':^4}"
+        colour = getattr(Colour, meta["colour"].upper(), Colour.RESET)
+        plain = f" {base} "
+        cursor = f"[{base}]"
+        if action:
+            plain = f"{colour}{plain}{Colour.RESET}"
+            cursor = f"{colour}{cursor}{Colour.RESET}"
+        tokens = _TOKEN_CACHE[action] = (
+            plain,
+            cursor,
+            f"{Colour.BOLD}{plain}{Colour.RESET}",
+            f"{Colour.BOLD}{cursor}{Colour.RESET}",
+        )
+    return tokens
 
-def _colourize(label: str, colour_name: str) -> str:
-    colour_value = getattr(Colour, colour_name.upper(), Colour.RESET)
-    return f"{colour_value}{label}{Colour.RESET}"
+
+# Prime every known action (plus the empty slot) so the first board render is all hits.
+for _action in (None, *ACTION_METADATA, *HEAVY_TRAINING_ACTIONS, *LIGHT_TRAINING_ACTIONS):
+    _slot_tokens(_action)
+del _action
 
 
 def _infer_squad_status(player: Optional[Player]) -> str:
@@ -182,69 +243,97 @@ def _infer_squad_status(player: Optional[Player]) -> str:
     return SQUAD_SECOND_STRING
 
 
-def build_mandatory_schedule(player: Optional[Player]) -> Dict[Tuple[int, int], str]:
-    base = dict(MANDATORY_TEAM_POLICY)
+# Both possible mandatory schedules are fixed, so compose them once. They are
+# shared between callers and therefore exposed as read-only views.
+_FIRST_STRING_SCHEDULE: Mapping[Tuple[int, int], str] = MappingProxyType(
+    {**MANDATORY_TEAM_POLICY, **FIRST_STRING_WEEKEND}
+)
+_SECOND_STRING_SCHEDULE: Mapping[Tuple[int, int], str] = MappingProxyType(
+    {**MANDATORY_TEAM_POLICY, **SECOND_STRING_WEEKEND}
+)
+
+
+def build_mandatory_schedule(player: Optional[Player]) -> Mapping[Tuple[int, int], str]:
     squad = _infer_squad_status(player)
-    weekend = FIRST_STRING_WEEKEND if squad == SQUAD_FIRST_STRING else SECOND_STRING_WEEKEND
-    base.update(weekend)
-    return base
+    return _FIRST_STRING_SCHEDULE if squad == SQUAD_FIRST_STRING else _SECOND_STRING_SCHEDULE
+
+
+def _build_mandatory_mask(mandatory_schedule: Mapping[Tuple[int, int], str]) -> int:
+    """Bitmask of mandatory slots, bit ``day * 3 + slot`` set when the slot is mandatory."""
+    mask = 0
+    for day_idx, slot_idx in mandatory_schedule:
+        mask |= 1 << (day_idx * 3 + slot_idx)
+    return mask
 
 
 def _get_active_player(context: GameContext) -> Optional[Player]:
     if context.player_id is None:
         return None
-    return context.session.get(Player, context.player_id)
+    return context.session.get(
+        Player,
+        context.player_id,
+        options=[selectinload(Player.school)],
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _coach_order_for(player_id: int, current_week: int) -> CoachOrder:
+    seed = player_id * 97 + current_week * 31
+    rng = random.Random(seed)
+    return rng.choice(COACH_ORDER_DEFS)
 
 
 def _select_coach_order(player: Optional[Player], current_week: int) -> Optional[CoachOrder]:
     if not player or not COACH_ORDER_DEFS:
         return None
-    seed = (getattr(player, 'id', 0) or 0) * 97 + current_week * 31
-    rng = random.Random(seed)
-    return rng.choice(COACH_ORDER_DEFS)
+    return _coach_order_for(getattr(player, 'id', 0) or 0, current_week)
+
+
+def _compile_order_requirement(order: CoachOrder) -> Optional[Tuple[FrozenSet[str], int]]:
+    if order.req_type != 'action_count':
+        return None
+    return frozenset(order.req_actions), order.req_count
+
+
+# Coach's Orders requirements parsed once: key -> (counted actions, target count).
+_ORDER_INDEX: Dict[str, Tuple[FrozenSet[str], int]] = {}
+for _order in COACH_ORDER_DEFS:
+    _compiled = _compile_order_requirement(_order)
+    if _compiled is not None:
+        _ORDER_INDEX[_order.key] = _compiled
+del _order, _compiled
+
+
+def _order_requirement(order: CoachOrder) -> Optional[Tuple[FrozenSet[str], int]]:
+    compiled = _ORDER_INDEX.get(order.key)
+    if compiled is None:
+        compiled = _compile_order_requirement(order)
+    return compiled
 
 
 def _describe_order_requirement(order: CoachOrder) -> str:
-    requirement = order.requirement or {}
-    if requirement.get('type') == 'action_count':
-        actions = requirement.get('actions') or []
-        action_labels = ", ".join(action.replace('_', ' ').title() for action in actions)
-        count = requirement.get('count', 0)
-        return f"{count}x [{action_labels}]"
+    if order.req_type == 'action_count':
+        action_labels = ", ".join(action.replace('_', ' ').title() for action in order.req_actions)
+        return f"{order.req_count}x [{action_labels}]"
     return "Unknown"
 
 
 def _evaluate_order_progress(order: Optional[CoachOrder], slot_results: List['SlotResult']) -> Optional[Dict[str, int]]:
     if not order:
         return None
-    requirement = order.requirement or {}
-    if requirement.get('type') == 'action_count':
-        actions = set(requirement.get('actions') or [])
-        progress = sum(1 for result in slot_results if result.action in actions)
-        target = int(requirement.get('count', 0))
-        return {
-            "progress": progress,
-            "target": target,
-            "completed": int(progress >= target),
-        }
-    return {"progress": 0, "target": 0, "completed": 0}
-
-
-def _calculate_schedule_order_progress(
-    order: Optional[CoachOrder], schedule_state: List[List[Optional[str]]]
-) -> Optional[Dict[str, int]]:
-    if not order:
-        return None
-    requirement = order.requirement or {}
-    if requirement.get('type') != 'action_count':
-        return None
-    actions = set(requirement.get('actions') or [])
-    target = int(requirement.get('count', 0))
-    progress = 0
-    for day_slots in schedule_state:
-        for entry in day_slots:
-            if entry in actions:
-                progress += 1
+    compiled = _order_requirement(order)
+    if compiled is None:
+        return {"progress": 0, "target": 0, "completed": 0}
+    actions, target = compiled
+    progress = sum(1 for result in slot_results if result.action in actions)
+    return {
+        "progress": progress,
+        "target": target,
+        "completed": int(progress >= target),
+    }
+
+
+def _schedule_progress_payload(progress: int, target: int) -> Dict[str, int]:
     return {
         "progress": progress,
         "target": target,
@@ -253,34 +342,28 @@ def _calculate_schedule_order_progress(
     }
 
 
-def _team_load_snapshot(player: Optional[Player]) -> Optional[Tuple[float, float]]:
+def _team_load_snapshot(session, player: Optional[Player]) -> Optional[Tuple[float, float]]:
     if not player:
         return None
     school_id = getattr(player, "school_id", None)
     if not school_id:
         return None
-    roster: Optional[List[Player]] = None
-    session = object_session(player)
-    if session is not None:
-        try:
-            roster = session.query(Player).filter(Player.school_id == school_id).all()
-        except Exception:
-            roster = None
-    if not roster:
-        school = getattr(player, "school", None)
-        roster = list(getattr(school, "players", []) or []) if school else None
-    if not roster:
-        return None
-    total_fatigue = 0.0
-    total_stamina = 0.0
-    count = 0
-    for member in roster:
-        total_fatigue += float(getattr(member, "fatigue", 0) or 0)
-        total_stamina += float(getattr(member, "stamina", 0) or 0)
-        count += 1
-    if count == 0:
+    avg_fatigue, avg_stamina, count = session.execute(
+        select(
+            func.avg(func.coalesce(Player.fatigue, 0)),
+            func.avg(func.coalesce(Player.stamina, 0)),
+            func.count(Player.id),
+        ).where(Player.school_id == school_id)
+    ).one()
+    if not count:
         return None
-    return (total_fatigue / count, total_stamina / count)
+    return (float(avg_fatigue), float(avg_stamina))
+
+
+def _dump_payload(payload: Dict[str, object]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload)
 
 
 def _record_coach_order_result(
@@ -321,7 +404,11 @@ def _record_coach_order_result(
         "order": {
             "key": coach_order.key,
             "description": coach_order.description,
-            "requirement": coach_order.requirement,
+            "requirement": {
+                "type": coach_order.req_type,
+                "actions": list(coach_order.req_actions),
+                "count": coach_order.req_count,
+            },
             "reward_trust": coach_order.reward_trust,
             "reward_ability_points": coach_order.reward_ability_points,
         },
@@ -338,7 +425,7 @@ def _record_coach_order_result(
         "timestamp": int(time.time()),
     }
 
-    gamestate_row.last_coach_order_result = json.dumps(payload)
+    gamestate_row.last_coach_order_result = _dump_payload(payload)
     session.add(gamestate_row)
 
 # --- TRUST + PRESENTATION HELPERS ---
@@ -439,27 +526,31 @@ def _initialize_week(
     if not player:
         return None, None, None, None
 
-    for key in ('mentor_training', 'rival_pressure', 'skipped_mandatory_slots'):
-        context.clear_temp_effect(key)
+    context.clear_temp_effects(('mentor_training', 'rival_pressure', 'skipped_mandatory_slots'))
+    # Rebuild the practice-opponent pool at most once per week.
+    invalidate_opponent_cache(context.school_id)
 
     session = context.session
     seed_relationships(session, player)
 
     if context.school_id:
+        # Same session: ``player`` is the identity-map row the roster pass updated,
+        # and its commit already expired it, so no explicit refresh is needed.
         run_roster_logic(target_school_id=context.school_id, db_session=session)
-        session.refresh(player)
 
     exam_summary = maybe_run_academic_exam(player, current_week)
     if exam_summary:
-        session.add(player)
+        # Commit now: the planning board can sit open for minutes, and an
+        # aborted execution must not lose the exam result.
         session.commit()
 
     event_text = None
     if enable_events:
         event_text = trigger_random_event(context, current_week)
 
-    player = _get_active_player(context)
-    coach_order = _select_coach_order(player, current_week) if player else None
+    # Events commit through the same session, so ``player`` is still the live
+    # identity-map instance; expired attributes reload on access.
+    coach_order = _select_coach_order(player, current_week)
     return player, coach_order, exam_summary, event_text
 
 
@@ -473,8 +564,10 @@ def _finalize_week_outcomes(
     summary: WeekSummary,
     exam_summary: Optional[dict] = None,
     event_text: Optional[str] = None,
+    player: Optional[Player] = None,
 ) -> WeekSummary:
-    player = _get_active_player(context)
+    if player is None:
+        player = _get_active_player(context)
     session = context.session
 
     if exam_summary:
@@ -500,7 +593,6 @@ def _finalize_week_outcomes(
             old_trust = player.trust_baseline or 50
             player.trust_baseline = min(100, old_trust + trust_gain)
             player.ability_points = (player.ability_points or 0) + ability_gain
-            session.add(player)
             reward_delta = {"trust": trust_gain, "ability_points": ability_gain}
             summary.add_event(
                 f"Coach's Orders complete (+{trust_gain} Trust / +{ability_gain} Ability)."
@@ -521,8 +613,6 @@ def _finalize_week_outcomes(
 
     penalty_payload = _process_skipped_penalties(context, player, skipped_mandatory)
     if penalty_payload:
-        session.add(player)
-        session.commit()
         summary.add_warning(
             f"Coach trust -{penalty_payload['trust_penalty']} / Morale -{penalty_payload['morale_penalty']}"
         )
@@ -533,8 +623,7 @@ def _finalize_week_outcomes(
             summary.add_warning(
                 f"Skipped {slot['day']} {slot['slot']}: expected {expected} -> {chosen}"
             )
-    else:
-        session.commit()
+    session.commit()
 
     school = getattr(player, "school", None)
     team_name = getattr(school, "name", "Team")
@@ -570,11 +659,10 @@ def _inject_order_requirements(
 ) -> None:
     if not coach_order:
         return
-    requirement = coach_order.requirement or {}
-    if requirement.get('type') != 'action_count':
+    if coach_order.req_type != 'action_count':
         return
-    actions = list(requirement.get('actions') or [])
-    target = int(requirement.get('count', 0))
+    actions = coach_order.req_actions
+    target = coach_order.req_count
     if not actions or target <= 0:
         return
     slots = [
@@ -641,52 +729,57 @@ def run_week_automatic(context: GameContext, current_week: int):
         summary=summary,
         exam_summary=exam_summary,
         event_text=None,
+        player=player,
     )
-    refreshed_player = _get_active_player(context)
-    if refreshed_player and (refreshed_player.fatigue or 0) >= SMART_SIM_FATIGUE_CAP:
+    if (player.fatigue or 0) >= SMART_SIM_FATIGUE_CAP:
         summary.flag_interrupt(
-            f"Fatigue reached {(refreshed_player.fatigue or 0)}%."
+            f"Fatigue reached {(player.fatigue or 0)}%."
         )
     return execution, summary
 
 # --- HELPER FUNCTIONS ---
 
+def _unflatten_schedule(schedule_slots: List[Optional[str]]) -> List[List[Optional[str]]]:
+    """Rebuild the day-major 7x3 grid consumed by execute_schedule_core."""
+    return [schedule_slots[day * 3:day * 3 + 3] for day in range(7)]
+
+
 def get_action_cost(action_key):
-    if not action_key:
-        return 0
-    if action_key in HEAVY_TRAINING_ACTIONS:
-        return ACTION_COSTS['train_heavy']
-    if action_key in LIGHT_TRAINING_ACTIONS:
-        return ACTION_COSTS['train_light']
-    return ACTION_COSTS.get(action_key, 0)
+    return _ACTION_COST_TABLE.get(action_key, 0) if action_key else 0
+
+
+# Constant board chrome, built once rather than on every keystroke.
+_PLANNING_HEADER_ROW = "      " + " ".join(f"{d[:3]:^6}" for d in DAYS_OF_WEEK)
+_PLANNING_DIVIDER = "-" * 72
+_BOARD_HOME = "\x1b[H"
+_BOARD_LINE_BREAK = "\x1b[K\n"
+_BOARD_ERASE_BELOW = "\x1b[J"
+
 
 def render_planning_ui(
     schedule_state,
     current_day_idx,
     current_slot_idx,
     current_fatigue,
-    mandatory_schedule: Dict[Tuple[int, int], str],
+    mandatory_schedule: Mapping[Tuple[int, int], str],
     coach_order: Optional[CoachOrder] = None,
     order_progress: Optional[Dict[str, int]] = None,
     team_load_snapshot: Optional[Tuple[float, float]] = None,
     school=None,
+    mandatory_mask: Optional[int] = None,
+    full_clear: bool = False,
 ):
-    """Draws the weekly calendar grid with action metadata + cursor focus."""
-
-    def _slot_token(action: Optional[str], is_cursor: bool, is_mandatory: bool) -> str:
-        key = _action_meta_key(action)
-        meta = ACTION_METADATA.get(key, ACTION_METADATA_DEFAULT)
-        short = meta["short"][:4]
-        base = short if action else "...."
-        token = f"[{base:^4}]" if is_cursor else f" {base:^4} "
-        if action:
-            token = _colourize(token, meta["colour"])
-        if is_mandatory:
-            token = f"{Colour.BOLD}{token}{Colour.RESET}"
-        return token
+    """Draws the weekly calendar grid with action metadata + cursor focus.
 
-    clear_screen()
-    print(f"{Colour.HEADER}=== WEEKLY PLANNING ==={Colour.RESET}")
+    ``schedule_state`` is the planner's flat slot list indexed ``day * 3 + slot``.
+    Pass ``full_clear`` for the first paint or when prompts have printed below
+    the board, since those lines may have scrolled it out of the home position.
+    """
+
+    if mandatory_mask is None:
+        mandatory_mask = _build_mandatory_mask(mandatory_schedule)
+
+    lines = [f"{Colour.HEADER}=== WEEKLY PLANNING ==={Colour.RESET}"]
 
     if team_load_snapshot:
         avg_fatigue, avg_stamina = team_load_snapshot
@@ -701,29 +794,29 @@ def render_planning_ui(
         else:
             badge = f"{Colour.GREEN}[READY]{Colour.RESET}"
             status = "Team cleared for optional reps"
-        print(
+        lines.append(
             f" Team Load {badge}  Fatigue {avg_fatigue:5.1f}% | Stamina {avg_stamina:5.1f}  — {status}"
         )
         if not rest_lock:
-            print(
+            lines.append(
                 f"  Cushion: {max(0.0, 65.0 - avg_fatigue):4.1f} fatigue pts / {max(0.0, avg_stamina - 55.0):4.1f} stamina pts"
             )
         else:
-            print("  Coaches will cancel optional workouts until the roster recovers.")
+            lines.append("  Coaches will cancel optional workouts until the roster recovers.")
 
-    header = "      " + " ".join([f"{d[:3]:^6}" for d in DAYS_OF_WEEK])
-    print(header)
+    lines.append(_PLANNING_HEADER_ROW)
 
     for s_idx, slot_name in enumerate(SLOTS):
-        row_str = f"{slot_name[0].upper()} | "
+        parts = [f"{slot_name[0].upper()} | "]
         for d_idx in range(7):
-            action = schedule_state[d_idx][s_idx]
+            action = schedule_state[d_idx * 3 + s_idx]
             is_cursor = (d_idx, s_idx) == (current_day_idx, current_slot_idx)
-            is_mandatory = (d_idx, s_idx) in mandatory_schedule
-            row_str += _slot_token(action, is_cursor, is_mandatory) + " "
-        print(row_str)
+            is_mandatory = bool(mandatory_mask & (1 << (d_idx * 3 + s_idx)))
+            parts.append(_slot_tokens(action)[is_mandatory << 1 | is_cursor])
+            parts.append(" ")
+        lines.append("".join(parts))
 
-    print("-" * 72)
+    lines.append(_PLANNING_DIVIDER)
 
     f_col = Colour.GREEN
     if current_fatigue > 50:
@@ -731,34 +824,34 @@ def render_planning_ui(
     if current_fatigue > 90:
         f_col = Colour.RED
 
-    print(f"Projected Fatigue: {f_col}{current_fatigue}/100{Colour.RESET}")
+    lines.append(f"Projected Fatigue: {f_col}{current_fatigue}/100{Colour.RESET}")
     if current_fatigue > 100:
-        print(f"{Colour.FAIL}!!! DANGER: INJURY RISK EXTREME !!!{Colour.RESET}")
+        lines.append(f"{Colour.FAIL}!!! DANGER: INJURY RISK EXTREME !!!{Colour.RESET}")
     elif current_fatigue > 85:
-        print(f"{Colour.WARNING}Warning: High injury risk.{Colour.RESET}")
+        lines.append(f"{Colour.WARNING}Warning: High injury risk.{Colour.RESET}")
 
     focus_label = "Review" if current_day_idx >= 7 else f"{DAYS_OF_WEEK[current_day_idx]} {SLOTS[current_slot_idx]}"
-    print(f"Planning Focus: {Colour.BOLD}{focus_label}{Colour.RESET}")
+    lines.append(f"Planning Focus: {Colour.BOLD}{focus_label}{Colour.RESET}")
 
     if current_day_idx < 7:
-        planned_action = schedule_state[current_day_idx][current_slot_idx]
+        planned_action = schedule_state[current_day_idx * 3 + current_slot_idx]
         fallback_action = mandatory_schedule.get((current_day_idx, current_slot_idx))
         focus_action = planned_action or fallback_action
         if focus_action:
-            meta = ACTION_METADATA.get(_action_meta_key(focus_action), ACTION_METADATA_DEFAULT)
+            meta = _action_meta(focus_action)
             desc = meta.get("desc") or "No description"
-            print(f"Selected Slot Effect: {Colour.BOLD}{desc}{Colour.RESET}")
+            lines.append(f"Selected Slot Effect: {Colour.BOLD}{desc}{Colour.RESET}")
             if fallback_action and planned_action != fallback_action:
-                print(
+                lines.append(
                     f"{Colour.WARNING}Coach expects {fallback_action.replace('_', ' ').title()} here.{Colour.RESET}"
                 )
     if coach_order:
         req_text = _describe_order_requirement(coach_order)
-        print(
+        lines.append(
             f"Coach's Orders: {Colour.BOLD}{coach_order.description}{Colour.RESET} ({req_text})"
         )
         effective_trust, effective_ability = _effective_order_rewards(coach_order, school)
-        print(
+        lines.append(
             f" Reward: +{effective_trust} Trust / +{effective_ability} Ability Points"
         )
         if order_progress:
@@ -767,103 +860,156 @@ def render_planning_ui(
             remaining = order_progress.get("remaining", max(0, target - progress))
             status_colour = Colour.GREEN if progress >= target and target else Colour.CYAN
             status_label = "Completed" if progress >= target and target else f"{remaining} to go"
-            print(
+            lines.append(
                 f" Progress: {status_colour}{progress}/{target}{Colour.RESET} ({status_label})"
             )
 
+    if full_clear:
+        clear_screen()
+    # Repaint in place instead of spawning ``clear`` per keystroke: home the
+    # cursor, erase each line's leftovers, then everything below the board.
+    sys.stdout.write(_BOARD_HOME + _BOARD_LINE_BREAK.join(lines) + _BOARD_LINE_BREAK + _BOARD_ERASE_BELOW)
+    sys.stdout.flush()
+
+
+_SLOT_MENU = "\n".join(
+    (
+        f" 1. {Colour.CYAN}TRAIN{Colour.RESET} (Drills)",
+        f" 2. {Colour.GREEN}REST{Colour.RESET}  (Recover)",
+        f" 3. {Colour.BLUE}LIFE{Colour.RESET}  (Study/Social)",
+        f" 4. {Colour.YELLOW}MATCH{Colour.RESET}  (B-Team Scrimmage)",
+        " 0. BACK",
+    )
+)
+_DRILL_CHOICES = {
+    'p': 'train_power',
+    's': 'train_speed',
+    'st': 'train_stamina',
+    'c': 'train_control',
+    'co': 'train_contact',
+}
+_LIFE_CHOICES = {'s': 'study', 'f': 'social', 'm': 'mind'}
+# Actions picked through a second prompt, which prints below the slot menu.
+_SUBMENU_ACTIONS = frozenset(_DRILL_CHOICES.values()) | frozenset(_LIFE_CHOICES.values())
+
+
+def _choose_drill() -> Optional[str]:
+    print("   [P]ower  [S]peed  [St]amina  [C]ontrol  [Co]ntact  [B]ack")
+    return _DRILL_CHOICES.get(input("   Drill: ").lower().strip())
+
+
+def _choose_life() -> Optional[str]:
+    print("   [S]tudy  [F]riends  [M]ind  [B]ack")
+    return _LIFE_CHOICES.get(input("   Activity: ").lower().strip())
+
+
+_SLOT_CHOICE_HANDLERS = {
+    '1': _choose_drill,
+    '2': lambda: 'rest',
+    '3': _choose_life,
+    '4': lambda: 'b_team_match',
+    '0': lambda: 'BACK',
+}
+
+
 def get_slot_choice(current_action: Optional[str]) -> Optional[str]:
     """Prompts the user for an action selection, defaulting to the current value."""
-    print("\nSelect Action (Enter = keep current plan):")
+    lines = ["\nSelect Action (Enter = keep current plan):"]
     if current_action:
-        print(f" Current: {current_action.replace('_', ' ').title()}")
-    print(f" 1. {Colour.CYAN}TRAIN{Colour.RESET} (Drills)")
-    print(f" 2. {Colour.GREEN}REST{Colour.RESET}  (Recover)")
-    print(f" 3. {Colour.BLUE}LIFE{Colour.RESET}  (Study/Social)")
-    print(f" 4. {Colour.YELLOW}MATCH{Colour.RESET}  (B-Team Scrimmage)")
-    print(" 0. BACK")
+        lines.append(f" Current: {current_action.replace('_', ' ').title()}")
+    lines.append(_SLOT_MENU)
+    print("\n".join(lines))
 
     choice = input(">> ").strip().lower()
     if choice == "":
         return current_action
 
-    if choice == '1':
-        print("   [P]ower  [S]peed  [St]amina  [C]ontrol  [Co]ntact  [B]ack")
-        sub = input("   Drill: ").lower().strip()
-        mapping = {
-            'p': 'train_power',
-            's': 'train_speed',
-            'st': 'train_stamina',
-            'c': 'train_control',
-            'co': 'train_contact',
-        }
-        return mapping.get(sub)
-
-    if choice == '2':
-        return 'rest'
-
-    if choice == '3':
-        print("   [S]tudy  [F]riends  [M]ind  [B]ack")
-        sub = input("   Activity: ").lower().strip()
-        mapping = {'s': 'study', 'f': 'social', 'm': 'mind'}
-        return mapping.get(sub)
+    handler = _SLOT_CHOICE_HANDLERS.get(choice)
+    return handler() if handler else None
 
-    if choice == '4':
-        return 'b_team_match'
 
-    if choice == '0':
-        return 'BACK'
-
-    return None
- 
-def plan_week_ui(start_fatigue: int, player: Optional[Player], coach_order: Optional[CoachOrder] = None):
+def plan_week_ui(
+    start_fatigue: int,
+    player: Optional[Player],
+    coach_order: Optional[CoachOrder] = None,
+    team_snapshot: Optional[Tuple[float, float]] = None,
+    session=None,
+):
     """Interactive weekly planner that accounts for squad status + trust."""
 
     start_fatigue = start_fatigue or 0
     mandatory_schedule = build_mandatory_schedule(player)
+    mandatory_mask = _build_mandatory_mask(mandatory_schedule)
+    mandatory_flat = tuple(mandatory_schedule.get((day, slot)) for day in range(7) for slot in range(3))
 
-    schedule_grid = [[None for _ in range(3)] for _ in range(7)]
-    for (day, slot), action in mandatory_schedule.items():
-        schedule_grid[day][slot] = action
+    # Flat day-major slots (index day * 3 + slot); unflattened on return.
+    schedule_grid: List[Optional[str]] = list(mandatory_flat)
 
-    history: List[Tuple[int, int, List[List[Optional[str]]], int, List[Dict[str, object]]]] = []
+    # Undo entries are deltas: (day, slot, previous action, fatigue, skipped count, order count).
+    history: List[Tuple[int, int, Optional[str], int, int, int]] = []
     skipped_mandatory: List[Dict[str, object]] = []
 
     day_idx = 0
     slot_idx = 0
     current_fatigue = start_fatigue
-    team_snapshot = _team_load_snapshot(player)
-
+    if team_snapshot is None and session is not None:
+        team_snapshot = _team_load_snapshot(session, player)
+
+    # Track Coach's Orders progress incrementally instead of rescanning the grid per redraw.
+    compiled_order = _order_requirement(coach_order) if coach_order else None
+    tracks_order = compiled_order is not None
+    order_actions, order_target = compiled_order if tracks_order else (frozenset(), 0)
+    order_count = sum(1 for entry in schedule_grid if entry in order_actions)
+
+    # Only repaint the board after the plan or cursor actually changed; rejected
+    # input and declined confirmations leave the current board on screen.
+    # Anything printed beyond the slot menu forces a full clear on the next paint.
+    board_dirty = True
+    needs_clear = True
     while day_idx < 7:
-        progress_snapshot = _calculate_schedule_order_progress(coach_order, schedule_grid)
-        render_planning_ui(
-            schedule_grid,
-            day_idx,
-            slot_idx,
-            current_fatigue,
-            mandatory_schedule,
-            coach_order,
-            progress_snapshot,
-            team_snapshot,
-            getattr(player, 'school', None),
-        )
+        if board_dirty:
+            progress_snapshot = _schedule_progress_payload(order_count, order_target) if tracks_order else None
+            render_planning_ui(
+                schedule_grid,
+                day_idx,
+                slot_idx,
+                current_fatigue,
+                mandatory_schedule,
+                coach_order,
+                progress_snapshot,
+                team_snapshot,
+                getattr(player, 'school', None),
+                mandatory_mask,
+                full_clear=needs_clear,
+            )
+            board_dirty = False
+            needs_clear = False
 
-        mandatory_action = mandatory_schedule.get((day_idx, slot_idx))
-        current_action = schedule_grid[day_idx][slot_idx]
+        mandatory_action = mandatory_flat[day_idx * 3 + slot_idx]
+        current_action = schedule_grid[day_idx * 3 + slot_idx]
         action = get_slot_choice(current_action)
 
         if action == 'BACK':
             if not history:
                 print("Cannot go back further.")
-                time.sleep(1)
+                needs_clear = True
                 continue
-            day_idx, slot_idx, saved_grid, current_fatigue, skipped_mandatory = history.pop()
-            schedule_grid = [row[:] for row in saved_grid]
+            day_idx, slot_idx, previous_action, current_fatigue, skipped_count, order_count = history.pop()
+            schedule_grid[day_idx * 3 + slot_idx] = previous_action
+            del skipped_mandatory[skipped_count:]
+            board_dirty = True
             continue
 
         if not action:
+            needs_clear = True
             continue
 
+        if action in _SUBMENU_ACTIONS:
+            needs_clear = True
+
+        skipped_count = len(skipped_mandatory)
         if mandatory_action and action != mandatory_action:
+            needs_clear = True
             print(f"\n{Colour.FAIL}WARNING: Coach Kataoka is watching.{Colour.RESET}")
             print(
                 f"Skipping {mandatory_action.replace('_', ' ').title()} will significantly lower Coach Trust."
@@ -883,22 +1029,25 @@ def plan_week_ui(start_fatigue: int, player: Optional[Player], coach_order: Opti
         cost = get_action_cost(action)
         new_fatigue = max(0, current_fatigue + cost)
         if new_fatigue > 90:
+            needs_clear = True
             print(f"{Colour.FAIL}WARNING: Fatigue will reach {new_fatigue}. High injury risk!{Colour.RESET}")
             confirm = input("Confirm? (y/n): ").strip().lower()
             if confirm != 'y':
+                del skipped_mandatory[skipped_count:]
                 continue
 
-        grid_snapshot = [row[:] for row in schedule_grid]
-        history.append((day_idx, slot_idx, grid_snapshot, current_fatigue, skipped_mandatory.copy()))
-        schedule_grid[day_idx][slot_idx] = action
+        history.append((day_idx, slot_idx, current_action, current_fatigue, skipped_count, order_count))
+        order_count += (action in order_actions) - (schedule_grid[day_idx * 3 + slot_idx] in order_actions)
+        schedule_grid[day_idx * 3 + slot_idx] = action
         current_fatigue = new_fatigue
+        board_dirty = True
 
         slot_idx += 1
         if slot_idx > 2:
             slot_idx = 0
             day_idx += 1
 
-    final_progress = _calculate_schedule_order_progress(coach_order, schedule_grid)
+    final_progress = _schedule_progress_payload(order_count, order_target) if tracks_order else None
     render_planning_ui(
         schedule_grid,
         7,
@@ -909,10 +1058,12 @@ def plan_week_ui(start_fatigue: int, player: Optional[Player], coach_order: Opti
         final_progress,
         team_snapshot,
         getattr(player, 'school', None),
+        mandatory_mask,
+        full_clear=needs_clear,
     )
     input(f"\n{Colour.GREEN}Schedule Complete. Press Enter to Execute.{Colour.RESET}")
 
-    return schedule_grid, skipped_mandatory
+    return _unflatten_schedule(schedule_grid), skipped_mandatory
 
 def execute_schedule_silent(context: GameContext, schedule_grid, current_week):
     """Execute schedule math without emitting per-slot narration."""
@@ -948,7 +1099,14 @@ def start_week(context: GameContext, current_week: int) -> None:
     input("\nPress Enter to open the planning board...")
 
     start_fatigue = player.fatigue or 0
-    schedule_grid, skipped_mandatory = plan_week_ui(start_fatigue, player, coach_order)
+    team_snapshot = _team_load_snapshot(context.session, player)
+    schedule_grid, skipped_mandatory = plan_week_ui(
+        start_fatigue,
+        player,
+        coach_order,
+        team_snapshot,
+        session=context.session,
+    )
 
     try:
         execution, summary = execute_schedule_silent(context, schedule_grid, current_week)
@@ -966,6 +1124,7 @@ def start_week(context: GameContext, current_week: int) -> None:
         summary=summary,
         exam_summary=exam_summary,
         event_text=event_text,
+        player=player,
     )
 
     render_weekly_dashboard(summary)
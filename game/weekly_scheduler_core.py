@@ -4,9 +4,10 @@ import os
 import random
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from database.setup_db import Team
+from game.constants import A_TEAM_MATCH_ACTIONS
 from game.training_logic import apply_scheduled_action
 from game.game_context import GameContext
 
@@ -18,41 +19,47 @@ FAST_PRACTICE_MATCHES = os.getenv("FAST_PRACTICE_MATCHES", "").lower() in {"1",
 PRACTICE_OPPONENT_SAMPLE = int(os.getenv("PRACTICE_OPPONENT_SAMPLE", "0") or 0)
 
 
-def _pick_practice_opponent(session, school_id: Optional[int]) -> Optional[Team]:
+# school_id -> ids of every other team; the league is fixed once a save is populated.
+_OPPONENT_ID_CACHE: Dict[int, Tuple[int, ...]] = {}
+
+
+def invalidate_opponent_cache(school_id: Optional[int] = None) -> None:
+    """Drop cached opponent pools (all of them when ``school_id`` is None)."""
+    if school_id is None:
+        _OPPONENT_ID_CACHE.clear()
+    else:
+        _OPPONENT_ID_CACHE.pop(school_id, None)
+
+
+def _opponent_ids(session, school_id: int) -> Tuple[int, ...]:
+    ids = _OPPONENT_ID_CACHE.get(school_id)
+    if ids is None:
+        rows = session.query(Team.id).filter(Team.id != school_id).order_by(Team.id).all()
+        ids = _OPPONENT_ID_CACHE[school_id] = tuple(row[0] for row in rows)
+    return ids
+
+
+def _pick_practice_opponent(
+    session,
+    school_id: Optional[int],
+    opponent_ids: Optional[Tuple[int, ...]] = None,
+) -> Optional[Team]:
     if school_id is None:
         return None
 
-    base_query = session.query(Team).filter(Team.id != school_id)
-    total = base_query.count()
+    if opponent_ids is None:
+        opponent_ids = _opponent_ids(session, school_id)
+    total = len(opponent_ids)
     if total == 0:
         return None
 
     if PRACTICE_OPPONENT_SAMPLE and PRACTICE_OPPONENT_SAMPLE < total:
-        offsets = set()
-        while len(offsets) < PRACTICE_OPPONENT_SAMPLE:
-            offsets.add(random.randrange(total))
-        candidates = []
-        for offset in offsets:
-            opponent = (
-                session.query(Team)
-                .filter(Team.id != school_id)
-                .offset(offset)
-                .limit(1)
-                .first()
-            )
-            if opponent:
-                candidates.append(opponent)
-        if candidates:
-            return random.choice(candidates)
-
-    offset = random.randrange(total)
-    return (
-        session.query(Team)
-        .filter(Team.id != school_id)
-        .offset(offset)
-        .limit(1)
-        .first()
-    )
+        candidates = random.sample(opponent_ids, PRACTICE_OPPONENT_SAMPLE)
+        opponent_id = random.choice(candidates)
+    else:
+        opponent_id = opponent_ids[random.randrange(total)]
+    # Usually served from the identity map; only a cold row costs a SELECT.
+    return session.get(Team, opponent_id)
 
 
 @dataclass
@@ -207,6 +214,8 @@ def execute_schedule_core(
     warnings: List[str] = []
     headlines: List[str] = []
     progression_state: Dict[str, object] = {}
+    # Resolved on the first practice match and reused for the rest of the week.
+    opponent_ids: Optional[Tuple[int, ...]] = None
 
     for d_idx, day_slots in enumerate(schedule_grid):
         day_dirty = False
@@ -230,19 +239,26 @@ def execute_schedule_core(
                 )
                 slot_result.training_details = action_result
 
-                if 'match' in action and 'b_team' not in action:
-                    opponent = _pick_practice_opponent(session, context.school_id)
+                if action in A_TEAM_MATCH_ACTIONS:
+                    if opponent_ids is None:
+                        opponent_ids = _opponent_ids(session, context.school_id)
+                    opponent = _pick_practice_opponent(session, context.school_id, opponent_ids)
                     if not opponent:
                         slot_result.error = "No opponents available for practice match."
                     else:
                         slot_result.opponent_name = opponent.name
                         mode = "fast" if FAST_PRACTICE_MATCHES else "standard"
+                        # The match engine persists through its own session, so
+                        # release our write lock before handing over. This also
+                        # commits the day so far, including this slot's training:
+                        # if the match raises, the rollback below cannot undo it.
+                        session.commit()
                         winner, score = resolve_match(
                             my_team,
                             opponent,
                             tournament_name="Practice Match",
                             mode=mode,
-                            silent=False,
+                            silent=not context.animate,
                         )
                         if winner:
                             outcome = 'WON' if winner.id == my_team.id else 'LOST'
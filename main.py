@@ -1,9 +1,13 @@
+import functools
 import json
+import math
 import sys
 import os
 import time
 import random
 
+from sqlalchemy.orm import joinedload
+
 from core.event_bus import EventBus
 from database.setup_db import create_database, GameState, School, Player, get_session, safe_delete_db
 from ui.ui_display import Colour, clear_screen, render_weekly_dashboard
@@ -35,20 +39,29 @@ GLOBAL_EVENT_BUS = initialise_analytics(EventBus())
 MAIN_MENU_THEME = DEFAULT_THEME
 
 
-def print_banner(theme_name: str = MAIN_MENU_THEME):
-    """Render the global banner with themed framing."""
-
-    clear_screen()
+@functools.lru_cache(maxsize=None)
+def _banner_text(theme_name: str) -> str:
     theme = choose_theme(theme_name)
     width = 68
     deco = theme["decor"] * width
     title = "⚾  KING OF THE DIAMOND RPG: THE FINAL  ⚾"
     subtitle = "The Road to the Sacred Stadium begins here."
 
-    print(f"{theme['accent']}{deco}{Colour.RESET}")
-    print(f"{theme['accent']}{title.center(width)}{Colour.RESET}")
-    print(f"{theme['accent']}{deco}{Colour.RESET}")
-    print(f"{theme['muted']}{subtitle.center(width)}{Colour.RESET}\n")
+    return (
+        f"{theme['accent']}{deco}{Colour.RESET}\n"
+        f"{theme['accent']}{title.center(width)}{Colour.RESET}\n"
+        f"{theme['accent']}{deco}{Colour.RESET}\n"
+        f"{theme['muted']}{subtitle.center(width)}{Colour.RESET}\n\n"
+    )
+
+
+def print_banner(theme_name: str = MAIN_MENU_THEME):
+    """Render the global banner with themed framing."""
+
+    clear_screen()
+    # Themes never change at runtime, so each banner is formatted once.
+    sys.stdout.write(_banner_text(theme_name))
+    sys.stdout.flush()
 
 
 # -----------------------------------------------------
@@ -57,8 +70,9 @@ def print_banner(theme_name: str = MAIN_MENU_THEME):
 
 def ensure_world_population(session):
     """Ensure the database has a populated world map."""
+    # Only the 10-school threshold matters, so stop counting once it is reached.
     try:
-        school_count = session.query(School).count()
+        school_count = session.query(School.id).limit(10).count()
     except Exception:
         school_count = 0
 
@@ -116,7 +130,10 @@ def load_active_player(session, state):
 
 
 def get_player_info(session, state):
-    p = load_active_player(session, state)
+    if not state or not state.active_player_id:
+        return "Unknown Player"
+    # The status line always needs the school, so load it with the player.
+    p = session.get(Player, state.active_player_id, options=[joinedload(Player.school)])
     if p and p.school:
         last_first = " ".join(part for part in [getattr(p, 'last_name', ''), getattr(p, 'first_name', '')] if part).strip()
         display_name = last_first or p.name or "Unknown Player"
@@ -132,26 +149,55 @@ _DEFAULT_SIM_INTERRUPTS = {
 }
 
 
-def load_sim_interrupts():
+# Parsed interrupts keyed by the file's mtime so edits are still picked up.
+_SIM_INTERRUPTS_CACHE = {"mtime": None, "data": None}
+
+
+def _parse_sim_interrupts():
     try:
         with open(_SIM_INTERRUPT_PATH, "r", encoding="utf-8") as f:
             raw = json.load(f)
         if isinstance(raw, dict):
             parsed = {int(k): str(v) for k, v in raw.items() if str(k).isdigit()}
             return parsed or dict(_DEFAULT_SIM_INTERRUPTS)
-    except FileNotFoundError:
-        return dict(_DEFAULT_SIM_INTERRUPTS)
     except Exception:
         return dict(_DEFAULT_SIM_INTERRUPTS)
     return dict(_DEFAULT_SIM_INTERRUPTS)
 
 
+def load_sim_interrupts():
+    try:
+        mtime = os.stat(_SIM_INTERRUPT_PATH).st_mtime_ns
+    except OSError:
+        return dict(_DEFAULT_SIM_INTERRUPTS)
+
+    if _SIM_INTERRUPTS_CACHE["mtime"] != mtime:
+        _SIM_INTERRUPTS_CACHE["data"] = _parse_sim_interrupts()
+        _SIM_INTERRUPTS_CACHE["mtime"] = mtime
+    return dict(_SIM_INTERRUPTS_CACHE["data"])
+
+
+STORY_BEAT_CHANCE = 0.40
+
+
+def advance_calendar_week(state):
+    """Move the calendar forward one week, turning the month every fourth week."""
+    state.current_week += 1
+    if state.current_week % 4 == 0:
+        state.current_month = state.current_month % 12 + 1
+
+
 def run_smart_simulation(context, session, state, target_week: int):
     """Delegate consecutive weeks until an interrupt condition fires."""
 
     sim_interrupts = load_sim_interrupts()
     summaries = []
     reason = None
+    # Draw the story-beat stop once: the number of weeks before the first
+    # STORY_BEAT_CHANCE hit is geometric, same as rolling every week.
+    story_stop_week = state.current_week + int(
+        math.log(1.0 - random.random()) / math.log(1.0 - STORY_BEAT_CHANCE)
+    )
 
     while state.current_week < target_week:
         player = load_active_player(session, state)
@@ -164,7 +210,7 @@ def run_smart_simulation(context, session, state, target_week: int):
             break
 
         # Story beats still deserve manual choices.
-        if random.random() <= 0.40:
+        if state.current_week >= story_stop_week:
             reason = "Story event pending—take the reins."
             break
 
@@ -180,12 +226,9 @@ def run_smart_simulation(context, session, state, target_week: int):
             reason = summary.interrupt_reasons[-1] if summary.interrupt_reasons else "Week interrupted."
             break
 
-        state.current_week += 1
-        if state.current_week % 4 == 0:
-            state.current_month += 1
-            if state.current_month > 12:
-                state.current_month = 1
-        session.add(state)
+        # Commit the calendar right behind the week's own commits, so a crash
+        # can replay at most the week that was in flight.
+        advance_calendar_week(state)
         session.commit()
 
     print()
@@ -247,67 +290,81 @@ def rebuild_world_database():
 # -----------------------------------------------------
 
 def main_menu():
-    while True:
-        print_banner(MAIN_MENU_THEME)
-        session = get_session()
-
-        state = session.query(GameState).first()
-        has_save = state is not None
-        player_info = get_player_info(session, state) if has_save else "No Data"
-
-        theme = choose_theme(MAIN_MENU_THEME)
-        menu_lines = [
-            f"{theme['muted']}Current Active Game: {Colour.CYAN}{player_info}{Colour.RESET}",
-            "",
-            f"{theme['accent']}[1]{Colour.RESET} Continue Active Game",
-            f"{theme['accent']}[2]{Colour.RESET} Load Game (Select Slot)",
-            f"{theme['accent']}[3]{Colour.RESET} New Career (Reuse Current World)",
-            f"{theme['accent']}[4]{Colour.RESET} Rebuild World (Fresh Generation)",
-            f"{theme['accent']}[5]{Colour.RESET} Exit",
-        ]
-
-        panel("Main Menu", menu_lines, theme=MAIN_MENU_THEME, width=70)
-
-        choice = input("\nSelect: ")
-
-        # -----------------------
-        # CONTINUE GAME
-        # -----------------------
-        if choice == '1':
-            session.close()
-            run_game_loop()
+    # One session for the whole menu; close() at the end of each pass releases
+    # its connection and identity map, so the next redraw reads fresh rows.
+    session = get_session()
+    theme = choose_theme(MAIN_MENU_THEME)
+    # Only the active-game line changes between redraws.
+    active_game_prefix = f"{theme['muted']}Current Active Game: {Colour.CYAN}"
+    static_menu_lines = (
+        "",
+        f"{theme['accent']}[1]{Colour.RESET} Continue Active Game",
+        f"{theme['accent']}[2]{Colour.RESET} Load Game (Select Slot)",
+        f"{theme['accent']}[3]{Colour.RESET} New Career (Reuse Current World)",
+        f"{theme['accent']}[4]{Colour.RESET} Rebuild World (Fresh Generation)",
+        f"{theme['accent']}[5]{Colour.RESET} Exit",
+    )
+    # Redraws after an invalid or cancelled choice reuse the last summary;
+    # any flow that can touch the save clears it.
+    player_info = None
+    try:
+        while True:
+            print_banner(MAIN_MENU_THEME)
 
-        # -----------------------
-        # LOAD GAME
-        # -----------------------
-        elif choice == '2':
-            session.close()
-            if show_save_menu("LOAD"):
-                continue
+            if player_info is None:
+                state = session.query(GameState).first()
+                player_info = get_player_info(session, state) if state is not None else "No Data"
 
-        # -----------------------
-        # NEW GAME
-        # -----------------------
-        elif choice == '3':
-            session.close()
-            if start_new_career_same_world():
+            menu_lines = [active_game_prefix + player_info + Colour.RESET, *static_menu_lines]
+
+            panel("Main Menu", menu_lines, theme=MAIN_MENU_THEME, width=70)
+
+            choice = input("\nSelect: ")
+
+            # -----------------------
+            # CONTINUE GAME
+            # -----------------------
+            if choice == '1':
+                player_info = None
+                session.close()
                 run_game_loop()
 
-        # -----------------------
-        # EXIT
-        # -----------------------
-        elif choice == '4':
-            confirm = input(f"{Colour.RED}Rebuild entire world? This deletes all progress. (y/n): {Colour.RESET}")
-            if confirm.lower() == 'y':
+            # -----------------------
+            # LOAD GAME
+            # -----------------------
+            elif choice == '2':
+                player_info = None
                 session.close()
-                if rebuild_world_database():
-                    run_game_loop()
-            else:
+                if show_save_menu("LOAD"):
+                    continue
+
+            # -----------------------
+            # NEW GAME
+            # -----------------------
+            elif choice == '3':
+                player_info = None
                 session.close()
+                if start_new_career_same_world():
+                    run_game_loop()
+
+            # -----------------------
+            # EXIT
+            # -----------------------
+            elif choice == '4':
+                confirm = input(f"{Colour.RED}Rebuild entire world? This deletes all progress. (y/n): {Colour.RESET}")
+                if confirm.lower() == 'y':
+                    player_info = None
+                    session.close()
+                    if rebuild_world_database():
+                        run_game_loop()
+                else:
+                    session.close()
 
-        elif choice == '5':
-            sys.exit()
+            elif choice == '5':
+                sys.exit()
 
+            session.close()
+    finally:
         session.close()
 
 
@@ -315,10 +372,21 @@ def main_menu():
 # GAME LOOP
 # -----------------------------------------------------
 
+_MONTH_NAMES = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+# Shared by every run_game_loop call; per-career state is reset on entry.
+_GAME_CONTEXT = GameContext(session_factory=get_session)
+
+
 def run_game_loop():
     session = get_session()
-    context = GameContext(session_factory=get_session)
-    session.expire_all()
+    context = _GAME_CONTEXT
+    # A different save or career may have been loaded since the last run.
+    context.clear_all_temp_effects()
 
     state = initialize_game_state(session)
     user_player = check_first_time_setup(session, state)
@@ -328,8 +396,11 @@ def run_game_loop():
         context.close_session()
         return
 
+    user_player_id = user_player.id
     user_school_id = user_player.school_id
-    context.set_player(user_player.id, user_school_id)
+    context.set_player(user_player_id, user_school_id)
+    # Set by flows that may swap the active player or rewrite their school.
+    needs_player_reload = False
 
     # -----------------------
     # MAIN WEEKLY LOOP
@@ -338,22 +409,23 @@ def run_game_loop():
         while True:
             current_week = state.current_week
 
-            user_player = load_active_player(session, state)
-            if not user_player:
-                print("ERROR: Active player not found.")
-                break
+            if needs_player_reload or state.active_player_id != user_player_id:
+                user_player = load_active_player(session, state)
+                if not user_player:
+                    print("ERROR: Active player not found.")
+                    break
 
-            user_school_id = user_player.school_id
-            context.set_player(user_player.id, user_school_id)
+                user_player_id = user_player.id
+                user_school_id = user_player.school_id
+                context.set_player(user_player_id, user_school_id)
+                needs_player_reload = False
 
             print_banner()
-            month_names = [
-                "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
-            ]
-            month_label = month_names[(state.current_month - 1) % 12] if state.current_month else "--"
-            print(f"{Colour.gold}>>> YEAR {state.current_year} | WEEK {current_week} / 50{Colour.RESET}")
-            print(f"Date: {month_label} (Month {state.current_month})")
+            month_label = _MONTH_NAMES[(state.current_month - 1) % 12] if state.current_month else "--"
+            sys.stdout.write(
+                f"{Colour.gold}>>> YEAR {state.current_year} | WEEK {current_week} / 50{Colour.RESET}\n"
+                f"Date: {month_label} (Month {state.current_month})\n"
+            )
 
             # -----------------------------------------
             # SEASON END
@@ -377,6 +449,7 @@ def run_game_loop():
 
                 session.expire_all()
                 state = session.query(GameState).first()
+                needs_player_reload = True
                 continue
 
             # -----------------------------------------
@@ -409,6 +482,7 @@ def run_game_loop():
                 print(f"\n{Colour.WARNING}Winter Training Camp begins.{Colour.RESET}")
                 if input("Participate? (y/n): ").lower() == 'y':
                     run_training_camp_event(context)
+                    needs_player_reload = True
                 else:
                     print("You skipped camp.")
 
@@ -423,7 +497,7 @@ def run_game_loop():
             # TRAINING WEEK
             # -----------------------------------------
             context.refresh_session()
-            context.set_player(user_player.id, user_school_id)
+            context.set_player(user_player_id, user_school_id)
             print(f"{Colour.dim}Opening schedule...{Colour.RESET}")
             start_week(context, current_week)
 
@@ -445,6 +519,7 @@ def run_game_loop():
                 continue
             elif cmd == 'd':
                 show_save_menu("SAVE")
+                needs_player_reload = True
                 continue
             elif cmd == 'a':
                 target_input = input(
@@ -459,11 +534,7 @@ def run_game_loop():
                     target_week = state.current_week + 1
                 target_week = min(50, target_week)
                 # Advance once before automation, mirroring the normal flow.
-                state.current_week += 1
-                if state.current_week % 4 == 0:
-                    state.current_month += 1
-                    if state.current_month > 12:
-                        state.current_month = 1
+                advance_calendar_week(state)
                 session.commit()
                 if state.current_week >= target_week:
                     continue
@@ -480,12 +551,7 @@ def run_game_loop():
                 break
 
             # Advance week
-            state.current_week += 1
-
-            if state.current_week % 4 == 0:
-                state.current_month += 1
-                if state.current_month > 12:
-                    state.current_month = 1
+            advance_calendar_week(state)
 
             session.commit()
     finally:
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from game.rng import get_rng
 from match_engine.confidence import apply_fielding_error_confidence
 from world.defense_profiles import get_defense_profile
@@ -10,9 +12,24 @@ from world_sim.fielding_engine import (
 
 rng = get_rng()
 
+_MISSING = object()
+
 HOME_CONTACT_BONUS = 2
 HOME_POWER_BONUS = 0
 
+# Contact quality below each threshold maps to the trajectory at the same index;
+# anything above the last one is a Gapper or Deep Fly depending on power.
+_TRAJECTORY_THRESHOLDS = (35, 65, 85)
+_TRAJECTORY_NAMES = ("Grounder", "Fly", "Line Drive")
+# Launch-angle window (degrees) used to turn a trajectory into a physical hit.
+_LAUNCH_RANGES = {
+    "Grounder": (-5, 10),
+    "Fly": (15, 30),
+    "Line Drive": (10, 18),
+    "Gapper": (20, 28),
+    "Deep Fly": (28, 40),
+}
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
@@ -38,6 +55,30 @@ def _offense_team_id(state):
     return getattr(state.home_team, "id", None)
 
 
+_NO_WEATHER = (0, 0, 0.0, 0.0, 0.0, 0.0)
+
+
+def weather_coefficients(weather):
+    """
+    Return (carry_shift, contact_boost, error_add, slip_error_add,
+    fly_bonus_ft, ground_speed_bonus) for a weather profile.
+    Weather is rolled once per game, so callers derive these once and pass
+    them to ``resolve_contact``.
+    """
+    if weather is None:
+        return _NO_WEATHER
+    carry = weather.carry_modifier or 0
+    effects = getattr(weather, "effects", None)
+    return (
+        int(carry * 35),
+        int(carry * 25),
+        getattr(weather, "error_modifier", 0.0) or 0.0,
+        effects.ball_slip_chance * 2.2 if effects else 0.0,
+        effects.fly_ball_distance_delta_m * 3.28084 if effects else 0.0,
+        effects.ground_ball_speed_bonus if effects else 0.0,
+    )
+
+
 def _flow_multiplier(state, team_id):
     system = getattr(state, "momentum_system", None)
     if not system or team_id is None:
@@ -46,6 +87,23 @@ def _flow_multiplier(state, team_id):
 
 
 class ContactResult:
+    # One of these is built per ball in play; slots skip the per-instance __dict__.
+    __slots__ = (
+        "hit_type",
+        "description",
+        "rbi",
+        "outs",
+        "credited_hit",
+        "error_on_play",
+        "primary_position",
+        "runner_advances",
+        "special_play",
+        "extra_outs",
+        "sacrifice",
+        "rbi_credit",
+        "error_type",
+    )
+
     def __init__(
         self,
         hit_type,
@@ -78,7 +136,7 @@ class ContactResult:
         self.error_type = error_type
 
 
-def resolve_contact(contact_quality, batter, pitcher, state, power_mod=0, trait_mods=None):
+def resolve_contact(contact_quality, batter, pitcher, state, power_mod=0, trait_mods=None, weather_coefs=None):
     """
     Determines the result of a ball put in play.
     Uses contact_quality from pitch_logic + Batter Power + Randomness.
@@ -88,7 +146,12 @@ def resolve_contact(contact_quality, batter, pitcher, state, power_mod=0, trait_
     # Apply Power Mod (e.g. +25 from Power Swing)
     trait_mods = trait_mods or {}
     raw_power = batter.power + trait_mods.get("power", 0) + power_mod
-    running = getattr(batter, 'running', getattr(batter, 'speed', 50)) + trait_mods.get("speed", 0)
+    # Only look up `speed` when there is no `running` attribute, instead of
+    # evaluating the fallback on every ball in play.
+    running = getattr(batter, "running", _MISSING)
+    if running is _MISSING:
+        running = getattr(batter, "speed", 50)
+    running += trait_mods.get("speed", 0)
     offense_id = _offense_team_id(state)
     defense_id = _defense_team_id(state)
     flow_offense = _flow_multiplier(state, offense_id)
@@ -117,27 +180,24 @@ def resolve_contact(contact_quality, batter, pitcher, state, power_mod=0, trait_
     running = max(20.0, running)
     contact_quality = float(contact_quality)
     power_transfer = raw_power + rng.randint(0, 20)
-    weather = getattr(state, 'weather', None)
-    weather_effects = getattr(weather, 'effects', None)
-    carry_shift = 0
-    fly_distance_bonus_ft = 0.0
-    ground_speed_bonus = 0.0
+    (
+        carry_shift,
+        weather_contact_boost,
+        weather_error,
+        slip_error,
+        fly_distance_bonus_ft,
+        ground_speed_bonus,
+    ) = weather_coefs if weather_coefs is not None else weather_coefficients(getattr(state, "weather", None))
     error_scalar = 1.0
 
     trust_scalars = getattr(state, "fielding_trust_scalar", {}) or {}
     if trust_scalars and defense_id is not None:
         error_scalar *= trust_scalars.get(defense_id, 1.0)
 
-    if weather:
-        carry_shift = int((weather.carry_modifier or 0) * 35)
-        contact_quality += int((weather.carry_modifier or 0) * 25)
-        power_transfer += carry_shift
-        error_scalar += getattr(weather, "error_modifier", 0.0) or 0.0
-
-    if weather_effects:
-        fly_distance_bonus_ft = weather_effects.fly_ball_distance_delta_m * 3.28084
-        ground_speed_bonus = weather_effects.ground_ball_speed_bonus
-        error_scalar += weather_effects.ball_slip_chance * 2.2
+    contact_quality += weather_contact_boost
+    power_transfer += carry_shift
+    error_scalar += weather_error
+    error_scalar += slip_error
 
     error_scalar = max(0.6, min(1.8, error_scalar))
 
@@ -146,25 +206,15 @@ def resolve_contact(contact_quality, batter, pitcher, state, power_mod=0, trait_
         power_transfer += HOME_POWER_BONUS
     
     # Determine Trajectory
-    if contact_quality < 35:
-        trajectory = "Grounder"
-    elif contact_quality < 65:
-        trajectory = "Fly"
-    elif contact_quality < 85:
-        trajectory = "Line Drive"
+    bucket = bisect_right(_TRAJECTORY_THRESHOLDS, contact_quality)
+    if bucket < len(_TRAJECTORY_NAMES):
+        trajectory = _TRAJECTORY_NAMES[bucket]
     else:
         trajectory = "Gapper" if power_transfer < 80 else "Deep Fly"
 
     # Resolve Outcome based on Trajectory & Speed/Power
     # Map the abstract trajectory into physical launch parameters.
-    launch_ranges = {
-        "Grounder": (-5, 10),
-        "Fly": (15, 30),
-        "Line Drive": (10, 18),
-        "Gapper": (20, 28),
-        "Deep Fly": (28, 40),
-    }
-    launch_low, launch_high = launch_ranges.get(trajectory, (10, 25))
+    launch_low, launch_high = _LAUNCH_RANGES[trajectory]
     launch_angle = rng.uniform(launch_low, launch_high)
     base_exit_vel = raw_power * 0.6 + contact_quality * 0.45 + rng.uniform(-5, 5)
     if trajectory == "Grounder" and ground_speed_bonus:
@@ -180,7 +230,7 @@ def resolve_contact(contact_quality, batter, pitcher, state, power_mod=0, trait_
     defense_team = state.home_team if getattr(state, "top_bottom", "Top") == "Top" else state.away_team
     defense_profile = get_defense_profile(defense_team)
     alignment = build_defense_alignment(state, profile=defense_profile)
-    if weather_effects and fly_distance_bonus_ft and batted_ball.ball_type != "ground":
+    if fly_distance_bonus_ft and batted_ball.ball_type != "ground":
         original_distance = max(1.0, batted_ball.landing_distance)
         new_distance = max(70.0, original_distance + fly_distance_bonus_ft)
         scale = new_distance / original_distance
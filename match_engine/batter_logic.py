@@ -1316,6 +1316,7 @@ class AtBatStateMachine:
                         state,
                         power_mod=p_mod,
                         trait_mods=batter_trait_mods,
+                        weather_coefs=getattr(state, "weather_coefficients", None),
                     )
                 announce_play(contact_res)
                 reached_base = contact_res.hit_type != "Out"
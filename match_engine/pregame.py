@@ -10,6 +10,7 @@ from game.coach_strategy import export_mod_descriptors
 from game.player_progression import fetch_player_milestone_tags
 from game.rng import get_rng
 from core.event_bus import EventBus
+from match_engine.ball_in_play import weather_coefficients
 from match_engine.confidence import adjust_confidence, initialize_confidence
 from match_engine.momentum import MomentumSystem, PresenceProfile, PresenceSystem
 from match_engine.states import EventType
@@ -194,6 +195,8 @@ class MatchState:
         self.last_clutch_pitch_effect: Optional[Dict[str, Any]] = None
         self.player_milestones: dict[int, list[dict[str, object]]] = {}
         self.weather: WeatherProfile | None = None
+        # Derived once from ``weather`` and handed to resolve_contact on every ball in play.
+        self.weather_coefficients: tuple | None = None
         self.umpire: UmpireProfile | None = None
         self.umpire_mood: float = 0.0
         self.umpire_call_tilt: dict[int | None, dict[str, int]] = {}
@@ -614,6 +617,7 @@ def prepare_match(
     player_ids = [p.id for p in match_state.home_roster + match_state.away_roster if p and getattr(p, 'id', None)]
     match_state.set_player_milestones(fetch_player_milestone_tags(db_session, player_ids))
     match_state.weather = generate_weather_profile()
+    match_state.weather_coefficients = weather_coefficients(match_state.weather)
     if match_state.weather:
         description = match_state.weather.describe()
         match_state.log(f"Weather report: {description}")
@@ -118,3 +118,20 @@ def test_power_batter_creates_stronger_contact():
 
     hit_values = {"HR": 4, "3B": 3, "2B": 2, "1B": 1, "Out": 0}
     assert hit_values[power_result.hit_type] >= hit_values[contact_result.hit_type]
+
+
+def test_weather_coefficients_follow_profile_and_missing_weather():
+    from match_engine.ball_in_play import weather_coefficients
+    from world_sim.weather import WeatherEffects
+
+    effects = WeatherEffects(ball_slip_chance=0.1, ground_ball_speed_bonus=2.0, fly_ball_distance_delta_m=1.0)
+    weather = SimpleNamespace(carry_modifier=0.2, error_modifier=0.05, effects=effects)
+
+    carry_shift, contact_boost, error_add, slip_add, fly_bonus_ft, ground_bonus = weather_coefficients(weather)
+
+    assert (carry_shift, contact_boost) == (7, 5)
+    assert error_add == 0.05
+    assert slip_add == 0.1 * 2.2
+    assert fly_bonus_ft == 3.28084
+    assert ground_bonus == 2.0
+    assert weather_coefficients(None) == (0, 0, 0.0, 0.0, 0.0, 0.0)
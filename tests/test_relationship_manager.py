@@ -0,0 +1,27 @@
+from database.setup_db import Player, PlayerRelationship, School, SessionLocal
+from game.relationship_manager import seed_relationships
+
+
+def test_seed_relationships_commits_new_row_without_teammates():
+    session = SessionLocal()
+    school = School(name="Solo Academy", prefecture="Test", prestige=5)
+    session.add(school)
+    session.commit()
+    player = Player(name="Lone Walker", position="Pitcher", school_id=school.id, year=1, jersey_number=1)
+    session.add(player)
+    session.commit()
+
+    observer = SessionLocal()
+    try:
+        rel = seed_relationships(session, player)
+        assert rel.captain_id is None
+
+        stored = observer.query(PlayerRelationship).filter_by(player_id=player.id).one_or_none()
+        assert stored is not None
+    finally:
+        observer.close()
+        session.query(PlayerRelationship).filter_by(player_id=player.id).delete()
+        session.query(Player).filter(Player.school_id == school.id).delete()
+        session.query(School).filter(School.id == school.id).delete()
+        session.commit()
+        session.close()
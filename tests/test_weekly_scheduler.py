@@ -1,6 +1,8 @@
 import json
 
-from database.setup_db import GameState, Player, School, SessionLocal
+import pytest
+
+from database.setup_db import GameState, Player, PlayerRelationship, School, SessionLocal
 from game.weekly_scheduler import CoachOrder, _record_coach_order_result
 
 
@@ -36,7 +38,9 @@ def test_record_coach_order_result_serializes_payload():
         order = CoachOrder(
             key="test_order",
             description="Complete two bullpen days",
-            requirement={"type": "action_count", "actions": ["train_control"], "count": 2},
+            req_type="action_count",
+            req_actions=("train_control",),
+            req_count=2,
             reward_trust=4,
             reward_ability_points=1,
         )
@@ -58,6 +62,11 @@ def test_record_coach_order_result_serializes_payload():
         assert payload["week"] == 7
         assert payload["player"]["id"] == player.id
         assert payload["order"]["key"] == "test_order"
+        assert payload["order"]["requirement"] == {
+            "type": "action_count",
+            "actions": ["train_control"],
+            "count": 2,
+        }
         assert payload["progress"]["value"] == 2
         assert payload["completed"] is True
         assert payload["reward_delta"]["ability_points"] == 1
@@ -68,3 +77,276 @@ def test_record_coach_order_result_serializes_payload():
         session.query(School).filter(School.id == school.id).delete()
         session.commit()
         session.close()
+
+
+
+def test_team_load_snapshot_averages_current_roster():
+    from game.weekly_scheduler import _team_load_snapshot
+
+    session = SessionLocal()
+    school = School(name="Load Prep", prefecture="Test", prestige=10)
+    session.add(school)
+    session.commit()
+    roster = [
+        Player(name="Ace", position="Pitcher", school_id=school.id, year=2, fatigue=40, stamina=60),
+        Player(name="Utility", position="Catcher", school_id=school.id, year=1, fatigue=60, stamina=50),
+    ]
+    session.add_all(roster)
+    session.commit()
+
+    try:
+        assert _team_load_snapshot(session, roster[0]) == (50.0, 55.0)
+        roster[0].fatigue = 100
+        session.commit()
+        assert _team_load_snapshot(session, roster[0]) == (80.0, 55.0)
+    finally:
+        session.query(Player).filter(Player.school_id == school.id).delete()
+        session.query(School).filter(School.id == school.id).delete()
+        session.commit()
+        session.close()
+
+
+def test_get_action_cost_resolves_training_tiers():
+    from game.constants import ACTION_COSTS
+    from game.weekly_scheduler import get_action_cost
+
+    assert get_action_cost("train_power") == ACTION_COSTS["train_heavy"]
+    assert get_action_cost("train_contact") == ACTION_COSTS["train_light"]
+    assert get_action_cost("rest") == ACTION_COSTS["rest"]
+    assert get_action_cost("unknown_action") == 0
+    assert get_action_cost(None) == 0
+
+
+def test_plan_week_ui_undo_restores_slot_and_skip_log(monkeypatch):
+    import builtins
+
+    import game.weekly_scheduler as scheduler
+
+    mandatory = scheduler.build_mandatory_schedule(None)
+    target = min(mandatory)
+
+    # Skip the first mandatory slot, undo it, then follow the coach's plan.
+    inputs = []
+    for day in range(7):
+        for slot in range(3):
+            if (day, slot) == target:
+                inputs += ["2", "y", "0"]
+            inputs.append("" if (day, slot) in mandatory else "2")
+    inputs.append("")
+    feed = iter(inputs)
+    monkeypatch.setattr(builtins, "input", lambda *_: next(feed))
+    monkeypatch.setattr(scheduler, "render_planning_ui", lambda *args, **kwargs: None)
+
+    grid, skipped = scheduler.plan_week_ui(0, None)
+
+    assert skipped == []
+    assert all(grid[day][slot] == action for (day, slot), action in mandatory.items())
+
+
+def test_plan_week_ui_full_clear_on_first_paint_and_after_warnings(monkeypatch):
+    import builtins
+
+    import game.weekly_scheduler as scheduler
+
+    mandatory = scheduler.build_mandatory_schedule(None)
+    target = min(mandatory)
+
+    inputs = []
+    for day in range(7):
+        for slot in range(3):
+            if (day, slot) == target:
+                inputs += ["2", "y", "0"]
+            inputs.append("" if (day, slot) in mandatory else "2")
+    inputs.append("")
+    feed = iter(inputs)
+    monkeypatch.setattr(builtins, "input", lambda *_: next(feed))
+    clears = []
+    monkeypatch.setattr(
+        scheduler,
+        "render_planning_ui",
+        lambda *args, full_clear=False, **kwargs: clears.append(full_clear),
+    )
+
+    scheduler.plan_week_ui(0, None)
+
+    # First paint, then the repaint after the skip warning; the undo and every
+    # plain slot pick repaint in place.
+    skip_paint = 1 + 3 * target[0] + target[1]
+    assert [idx for idx, flag in enumerate(clears) if flag] == [0, skip_paint]
+    assert len(clears) == 21 + 3
+
+
+def test_pick_practice_opponent_reuses_cached_pool():
+    from game import weekly_scheduler_core as core
+
+    session = SessionLocal()
+    home = School(name="Home Prep", prefecture="Test", prestige=10)
+    away = School(name="Away Prep", prefecture="Test", prestige=12)
+    session.add_all([home, away])
+    session.commit()
+
+    core.invalidate_opponent_cache(home.id)
+    try:
+        opponent = core._pick_practice_opponent(session, home.id)
+        assert opponent is not None and opponent.id != home.id
+        pool = core._OPPONENT_ID_CACHE[home.id]
+        assert away.id in pool and home.id not in pool
+
+        core._pick_practice_opponent(session, home.id)
+        assert core._OPPONENT_ID_CACHE[home.id] is pool
+
+        core.invalidate_opponent_cache(home.id)
+        assert home.id not in core._OPPONENT_ID_CACHE
+    finally:
+        core.invalidate_opponent_cache(home.id)
+        session.query(School).filter(School.id.in_([home.id, away.id])).delete()
+        session.commit()
+        session.close()
+
+
+def test_execute_schedule_core_commits_once_per_day(monkeypatch):
+    import sqlite3
+
+    from config import DB_PATH
+    from game import weekly_scheduler_core as core
+    from game.game_context import GameContext
+
+    session = SessionLocal()
+    school = School(name="Ledger Prep", prefecture="Test", prestige=10)
+    session.add(school)
+    session.commit()
+    player = Player(name="Counter", position="Pitcher", school_id=school.id, year=1, fatigue=10)
+    session.add(player)
+    session.commit()
+
+    observer = sqlite3.connect(DB_PATH)
+    seen = []
+
+    def _committed_fatigue():
+        return observer.execute("SELECT fatigue FROM players WHERE id = ?", (player.id,)).fetchone()[0]
+
+    def _fake_action(context, action, *, commit=True, progression_state=None):
+        seen.append(_committed_fatigue())
+        tracked = context.session.get(Player, player.id)
+        tracked.fatigue += 10
+        context.session.flush()
+        return {"message": action}
+
+    monkeypatch.setattr(core, "apply_scheduled_action", _fake_action)
+    context = GameContext(lambda: session)
+    context.set_player(player.id, school.id)
+    try:
+        grid = [["rest", "study", None], ["rest", None, None]]
+        execution = core.execute_schedule_core(context, grid, current_week=1)
+
+        assert [slot.action for slot in execution.results] == ["rest", "study", "rest"]
+        # Slots on the same day share one commit; the next day sees them.
+        assert seen == [10, 10, 30]
+        assert _committed_fatigue() == 40
+    finally:
+        observer.close()
+        session.query(Player).filter(Player.school_id == school.id).delete()
+        session.query(School).filter(School.id == school.id).delete()
+        session.commit()
+        session.close()
+
+
+def test_exam_result_survives_aborted_execution(monkeypatch):
+    import builtins
+
+    from game import weekly_scheduler as scheduler
+    from game.game_context import GameContext
+
+    setup = SessionLocal()
+    school = School(name="Exam Prep", prefecture="Test", prestige=10)
+    setup.add(school)
+    setup.commit()
+    player = Player(name="Crammer", position="Pitcher", school_id=school.id, year=1, academic_skill=60)
+    setup.add(player)
+    setup.commit()
+    player_id, school_id = player.id, school.id
+
+    def _abort(*_args, **_kwargs):
+        raise ValueError("no schedule")
+
+    graded = {}
+    real_exam = scheduler.maybe_run_academic_exam
+
+    def _graded_exam(exam_player, week):
+        summary = real_exam(exam_player, week)
+        graded["score"] = exam_player.test_score
+        return summary
+
+    monkeypatch.setattr(builtins, "input", lambda *_: "")
+    monkeypatch.setattr(scheduler, "run_roster_logic", lambda **_: None)
+    monkeypatch.setattr(scheduler, "trigger_random_event", lambda *_: None)
+    monkeypatch.setattr(scheduler, "plan_week_ui", lambda *args, **kwargs: ([], []))
+    monkeypatch.setattr(scheduler, "execute_schedule_silent", _abort)
+    monkeypatch.setattr(scheduler, "maybe_run_academic_exam", _graded_exam)
+
+    context = GameContext(SessionLocal)
+    context.set_player(player_id, school_id)
+    try:
+        scheduler.start_week(context, 6)
+        context.close_session()
+
+        observer = SessionLocal()
+        try:
+            assert observer.get(Player, player_id).test_score == pytest.approx(graded["score"])
+        finally:
+            observer.close()
+    finally:
+        context.close_session()
+        setup.query(PlayerRelationship).filter_by(player_id=player_id).delete()
+        setup.query(Player).filter(Player.school_id == school_id).delete()
+        setup.query(School).filter(School.id == school_id).delete()
+        setup.commit()
+        setup.close()
+
+
+def test_failed_practice_match_keeps_committed_training(monkeypatch):
+    import sqlite3
+
+    import match_engine
+    from config import DB_PATH
+    from game import weekly_scheduler_core as core
+    from game.game_context import GameContext
+
+    session = SessionLocal()
+    home = School(name="Rainout Prep", prefecture="Test", prestige=10)
+    away = School(name="Visitor Prep", prefecture="Test", prestige=10)
+    session.add_all([home, away])
+    session.commit()
+    player = Player(name="Starter", position="Pitcher", school_id=home.id, year=1, fatigue=10)
+    session.add(player)
+    session.commit()
+
+    def _fake_action(context, action, *, commit=True, progression_state=None):
+        context.session.get(Player, player.id).fatigue += 10
+        context.session.flush()
+        return {"message": action}
+
+    def _broken_match(*_args, **_kwargs):
+        raise RuntimeError("engine failure")
+
+    monkeypatch.setattr(core, "apply_scheduled_action", _fake_action)
+    monkeypatch.setattr(match_engine, "resolve_match", _broken_match)
+    core.invalidate_opponent_cache(home.id)
+    context = GameContext(lambda: session)
+    context.set_player(player.id, home.id)
+    observer = sqlite3.connect(DB_PATH)
+    try:
+        execution = core.execute_schedule_core(context, [["rest", "practice_match", None]], current_week=1)
+
+        # The pre-match commit already persisted both slots' training.
+        committed = observer.execute("SELECT fatigue FROM players WHERE id = ?", (player.id,)).fetchone()[0]
+        assert committed == 30
+        assert [slot.action for slot in execution.results] == ["rest"]
+        assert len(execution.warnings) == 1 and "engine failure" in execution.warnings[0]
+    finally:
+        observer.close()
+        core.invalidate_opponent_cache(home.id)
+        session.query(Player).filter(Player.school_id == home.id).delete()
+        session.query(School).filter(School.id.in_([home.id, away.id])).delete()
+        session.commit()
+        session.close()
@@ -1,5 +1,7 @@
+import io
 import json
 import os
+import sys
 from typing import Optional, Tuple
 
 from database.setup_db import Player
@@ -425,47 +427,53 @@ def render_weekly_dashboard(summary, *, clear: bool = True) -> None:
     if clear:
         clear_screen()
 
-    print(f"{Colour.HEADER}=== WEEK {summary.week_number} REPORT ==={Colour.RESET}")
+    # Build the whole report card first so it reaches the terminal in one write.
+    buf = io.StringIO()
+    emit = buf.write
+
+    emit(f"{Colour.HEADER}=== WEEK {summary.week_number} REPORT ==={Colour.RESET}\n")
 
     if summary.schedule_notes:
         for note in summary.schedule_notes:
-            print(f" {Colour.CYAN}•{Colour.RESET} {note}")
+            emit(f" {Colour.CYAN}•{Colour.RESET} {note}\n")
 
     if summary.newsletter:
-        print(f"\n{Colour.GREEN}[WEEKLY NEWS]{Colour.RESET}")
+        emit(f"\n{Colour.GREEN}[WEEKLY NEWS]{Colour.RESET}\n")
         for line in summary.newsletter:
-            print(f"  • {line}")
+            emit(f"  • {line}\n")
 
-    print(f"\n{Colour.CYAN}[TRAINING RESULTS]{Colour.RESET}")
-    print(f"  {_format_stat_map(summary.stat_gains)}")
+    emit(f"\n{Colour.CYAN}[TRAINING RESULTS]{Colour.RESET}\n")
+    emit(f"  {_format_stat_map(summary.stat_gains)}\n")
     if summary.xp_gains:
-        print(f"  XP: {_format_stat_map(summary.xp_gains)}")
+        emit(f"  XP: {_format_stat_map(summary.xp_gains)}\n")
 
     if summary.match_outcomes:
-        print(f"\n{Colour.YELLOW}[MATCH RESULTS]{Colour.RESET}")
+        emit(f"\n{Colour.YELLOW}[MATCH RESULTS]{Colour.RESET}\n")
         for match in summary.match_outcomes:
             slot = match.get("slot", "?")
             opponent = match.get("opponent", "Opponent")
             result = match.get("result", "-")
             score = match.get("score", "-")
             color = Colour.GREEN if result == 'WON' else Colour.FAIL if result == 'LOST' else Colour.YELLOW
-            print(f"  {slot}: vs {opponent} -> {color}{result}{Colour.RESET} ({score})")
+            emit(f"  {slot}: vs {opponent} -> {color}{result}{Colour.RESET} ({score})\n")
 
     if summary.events_triggered or summary.highlights:
-        print(f"\n{Colour.PURPLE}[NEWS FEED]{Colour.RESET}")
+        emit(f"\n{Colour.MAG}[NEWS FEED]{Colour.RESET}\n")
         for event in summary.events_triggered:
-            print(f"  ! {event}")
+            emit(f"  ! {event}\n")
         for highlight in summary.highlights:
-            print(f"  ★ {highlight}")
+            emit(f"  ★ {highlight}\n")
 
     if summary.warnings:
-        print(f"\n{Colour.WARNING}[WARNINGS]{Colour.RESET}")
+        emit(f"\n{Colour.WARNING}[WARNINGS]{Colour.RESET}\n")
         for warn in summary.warnings:
-            print(f"  ! {warn}")
+            emit(f"  ! {warn}\n")
 
     if summary.stopped_by_interrupt:
-        print(f"\n{Colour.FAIL}[AUTO-SIM INTERRUPTED]{Colour.RESET}")
+        emit(f"\n{Colour.FAIL}[AUTO-SIM INTERRUPTED]{Colour.RESET}\n")
         for reason in summary.interrupt_reasons:
-            print(f"  → {reason}")
+            emit(f"  → {reason}\n")
 
-    print("\nPress Enter to continue...", end="")
+    emit("\nPress Enter to continue...")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from operator import itemgetter
 
 from database.setup_db import School, Player, Coach, Roster, get_session
 from game.academic_system import is_academically_eligible
@@ -18,9 +19,11 @@ def run_roster_logic(target_school_id=None, db_session=None):
         db_session = get_session()
         close_session = True
 
-    schools = db_session.query(School).all()
     if target_school_id:
-        schools = [s for s in schools if s.id == target_school_id]
+        school = db_session.get(School, target_school_id)
+        schools = [school] if school else []
+    else:
+        schools = db_session.query(School).all()
         
     print(f"Running Roster AI for {len(schools)} schools...")
     
@@ -72,7 +75,7 @@ def update_school_roster(db_session, school):
         player_utilities.append((p, util))
         
     # Sort ALL players by Utility
-    player_utilities.sort(key=lambda x: x[1], reverse=True)
+    player_utilities.sort(key=itemgetter(1), reverse=True)
     
     # 2. Reset Roles
     db_session.query(Roster).filter_by(school_id=school.id).delete()